@@ -934,9 +934,9 @@ extern PyTypeObject TableScanType;
     for(i=0; i<w; i++) { \
         y = self->data[(int)(i*step)] * amp + amp + 2; \
         tuple = PyTuple_New(2); \
-        PyTuple_SetItem(tuple, 0, PyInt_FromLong(i)); \
-        PyTuple_SetItem(tuple, 1, PyInt_FromLong(h-y)); \
-        PyList_SetItem(samples, i, tuple); \
+        PyTuple_SET_ITEM(tuple, 0, PyInt_FromLong(i)); \
+        PyTuple_SET_ITEM(tuple, 1, PyInt_FromLong(h-y)); \
+        PyList_SET_ITEM(samples, i, tuple); \
     } \
  \
     return samples;
@@ -1008,27 +1008,30 @@ extern PyTypeObject TableScanType;
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "i", kwlist, &pos)) \
         return PyInt_FromLong(-1); \
  \
-    pos = -pos; \
-    while (pos > self->size) pos -= self->size; \
-    while (pos < 0) pos += self->size; \
- \
-    j = self->size; \
-    for (i=0; i<--j; i++) { \
-        tmp = self->data[i]; \
-        self->data[i] = self->data[j]; \
-        self->data[j] = tmp; \
-    } \
-    j = pos; \
-    for (i=0; i<--j; i++) { \
-        tmp = self->data[i]; \
-        self->data[i] = self->data[j]; \
-        self->data[j] = tmp; \
-    } \
-    j = self->size; \
-    for (i=pos; i<--j; i++) { \
-        tmp = self->data[i]; \
-        self->data[i] = self->data[j]; \
-        self->data[j] = tmp; \
+    /* Rotation is done in place by reversing the whole table, then \
+       both sides of the pivot. A full turn leaves the table as is. */ \
+    pos = self->size > 0 ? -pos % self->size : 0; \
+    if (pos < 0) pos += self->size; \
+ \
+    if (pos > 0) { \
+        j = self->size; \
+        for (i=0; i<--j; i++) { \
+            tmp = self->data[i]; \
+            self->data[i] = self->data[j]; \
+            self->data[j] = tmp; \
+        } \
+        j = pos; \
+        for (i=0; i<--j; i++) { \
+            tmp = self->data[i]; \
+            self->data[i] = self->data[j]; \
+            self->data[j] = tmp; \
+        } \
+        j = self->size; \
+        for (i=pos; i<--j; i++) { \
+            tmp = self->data[i]; \
+            self->data[i] = self->data[j]; \
+            self->data[j] = tmp; \
+        } \
     } \
  \
     self->data[self->size] = self->data[0]; \
@@ -1168,18 +1171,13 @@ extern PyTypeObject TableScanType;
 /* Normalize */
 #define NORMALIZE \
 	int i; \
-	MYFLT mi, ma, max, ratio; \
-	mi = ma = *self->data; \
-	for (i=1; i<self->size; i++) { \
-		if (mi > *(self->data+i)) \
-			mi = *(self->data+i); \
-		if (ma < *(self->data+i)) \
-			ma = *(self->data+i); \
+	MYFLT val, max, ratio; \
+	max = 0.0; \
+	for (i=0; i<self->size; i++) { \
+		val = MYFABS(self->data[i]); \
+		if (val > max) \
+			max = val; \
 	} \
-	if ((mi*mi) > (ma*ma)) \
-		max = MYFABS(mi); \
-	else \
-		max = MYFABS(ma); \
  \
 	if (max > 0.0) { \
 		ratio = 0.99 / max; \
@@ -1192,26 +1190,24 @@ extern PyTypeObject TableScanType;
 
 #define NORMALIZE_MATRIX \
     int i, j; \
-    MYFLT mi, ma, max, ratio; \
-    mi = ma = self->data[0][0]; \
-    for (i=1; i<self->height; i++) { \
-        for (j=1; j<self->width; j++) { \
-            if (mi > self->data[i][j]) \
-                mi = self->data[i][j]; \
-            if (ma < self->data[i][j]) \
-                ma = self->data[i][j]; \
+    MYFLT val, max, ratio; \
+    MYFLT *row; \
+    max = 0.0; \
+    for (i=0; i<self->height; i++) { \
+        row = self->data[i]; \
+        for (j=0; j<self->width; j++) { \
+            val = MYFABS(row[j]); \
+            if (val > max) \
+                max = val; \
         } \
     } \
-    if ((mi*mi) > (ma*ma)) \
-        max = MYFABS(mi); \
-    else \
-        max = MYFABS(ma); \
  \
     if (max > 0.0) { \
         ratio = 0.99 / max; \
         for (i=0; i<self->height+1; i++) { \
+            row = self->data[i]; \
             for (j=0; j<self->width+1; j++) { \
-                self->data[i][j] *= ratio; \
+                row[j] *= ratio; \
             } \
         } \
     } \
@@ -1252,28 +1248,40 @@ extern PyTypeObject TableScanType;
 
 /* Matrix macros */
 #define MATRIX_BLUR \
-    int i,j; \
-    MYFLT tmp[self->height][self->width]; \
- \
+    int i, j; \
+    MYFLT *prev, *cur, *next, *swap; \
     int lw = self->width - 1; \
     int lh = self->height - 1; \
-    for (i=1; i<lw; i++) { \
-        tmp[0][i] = (self->data[0][i-1] + self->data[0][i] + self->data[1][i] + self->data[0][i+1]) * 0.25; \
-        tmp[lh][i] = (self->data[lh][i-1] + self->data[lh][i] + self->data[lh-1][i] + self->data[lh][i+1]) * 0.25; \
-    } \
-    for (i=1; i<lh; i++) { \
-        tmp[i][0] = (self->data[i-1][0] + self->data[i][0] + self->data[i][1] + self->data[i+1][0]) * 0.25; \
-        tmp[i][lw] = (self->data[i-1][lw] + self->data[i][lw] + self->data[i][lw-1] + self->data[i+1][lw]) * 0.25; \
-    } \
  \
-    for (i=1; i<lh; i++) { \
+    /* Blur rows are produced one at a time into a ring of three buffers, \
+       so the vertical pass works on a few rows instead of a full copy. */ \
+    if (lh > 1 && lw > 1) { \
+        MYFLT rows[3][self->width]; \
+        prev = rows[0]; \
+        cur = rows[1]; \
+        next = rows[2]; \
         for (j=1; j<lw; j++) { \
-            tmp[i][j] = (self->data[i][j-1] + self->data[i][j] + self->data[i][j+1]) * 0.3333333; \
+            prev[j] = (self->data[0][j-1] + self->data[0][j] + self->data[1][j] + self->data[0][j+1]) * 0.25; \
+            cur[j] = (self->data[1][j-1] + self->data[1][j] + self->data[1][j+1]) * 0.3333333; \
         } \
-    } \
-    for (j=1; j<lw; j++) { \
         for (i=1; i<lh; i++) { \
-            self->data[i][j] = (tmp[i-1][j] + tmp[i][j] + tmp[i+1][j]) * 0.3333333; \
+            if (i+1 == lh) { \
+                for (j=1; j<lw; j++) { \
+                    next[j] = (self->data[lh][j-1] + self->data[lh][j] + self->data[lh-1][j] + self->data[lh][j+1]) * 0.25; \
+                } \
+            } \
+            else { \
+                for (j=1; j<lw; j++) { \
+                    next[j] = (self->data[i+1][j-1] + self->data[i+1][j] + self->data[i+1][j+1]) * 0.3333333; \
+                } \
+            } \
+            for (j=1; j<lw; j++) { \
+                self->data[i][j] = (prev[j] + cur[j] + next[j]) * 0.3333333; \
+            } \
+            swap = prev; \
+            prev = cur; \
+            cur = next; \
+            next = swap; \
         } \
     } \
     Py_INCREF(Py_None); \
@@ -1281,7 +1289,8 @@ extern PyTypeObject TableScanType;
 
 #define MATRIX_BOOST \
     int i, j; \
-    MYFLT min, max, boost, val; \
+    MYFLT min, max, boost, gain, offset; \
+    MYFLT *row; \
     min = -1.0; \
     max = 1.0; \
     boost = 0.01; \
@@ -1290,12 +1299,14 @@ extern PyTypeObject TableScanType;
     if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE__FFF, kwlist, &min, &max, &boost)) \
         return PyInt_FromLong(-1); \
  \
-    float mid = (min + max) * 0.5; \
+    /* val + (val - mid) * boost, with the constant terms folded. */ \
+    gain = 1.0 + boost; \
+    offset = (min + max) * 0.5 * boost; \
  \
     for (i=0; i<self->height; i++) { \
+        row = self->data[i]; \
         for (j=0; j<self->width; j++) { \
-            val = self->data[i][j]; \
-            self->data[i][j] = NewMatrix_clip(val + (val-mid) * boost, min, max); \
+            row[j] = NewMatrix_clip(row[j] * gain - offset, min, max); \
         } \
     } \
     Py_INCREF(Py_None); \
@@ -27,28 +27,35 @@ License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 import os
+import re
 import sys
 import random
 import inspect
 import tempfile
+from itertools import chain, cycle, islice, repeat
+from contextlib import contextmanager
 from subprocess import call
 from weakref import proxy
 
 if sys.version_info[0] < 3:
     import __builtin__
     builtins = __builtin__
+    from StringIO import StringIO
     bytes_t = str
     unicode_t = unicode
+    long_t = long
     def tobytes(strng, encoding=None):
         "Convert unicode string to bytes."
         return bytes(strng)
 else:
     import builtins
+    from io import StringIO
     bytes_t = bytes
     unicode_t = str
+    long_t = int
     def tobytes(strng, encoding="utf-8"):
         "Convert unicode string to bytes."
-        return bytes(strng, encoding=encoding)
+        return strng.encode(encoding)
 
 if hasattr(builtins, 'pyo_use_double'):
     from _pyo64 import *
@@ -135,21 +142,185 @@ class PyoServerStateException(PyoError):
 class PyoArgumentTypeError(PyoError):
     """Error raised when if an object got an invalid argument."""
 
+# Pyo classes, registered by stream type when they are defined (see
+# PyoObjectBase.__init_subclass__), used as a fast path by the isXXXObject
+# functions before falling back to isinstance checks.
+_AUDIO_TYPES = set()
+_TABLE_TYPES = set()
+_MATRIX_TYPES = set()
+_PV_TYPES = set()
+_STREAM_TYPE_REGISTRY = {'audio': _AUDIO_TYPES, 'table': _TABLE_TYPES,
+                         'matrix': _MATRIX_TYPES, 'pvoc': _PV_TYPES}
+_SENTINEL = object()
+# Builtin types that can never carry a pyo stream, rejected without any
+# attribute lookup by the isXXXObject functions below.
+_PLAIN_TYPES = frozenset((int, long_t, float, bool, bytes_t, unicode_t, list,
+                          tuple, dict, type(None)))
+
 def isAudioObject(obj):
     "Return True if the argument is an audio object."
-    return isinstance(obj, PyoObject) or hasattr(obj, "stream")
+    objtype = type(obj)
+    if objtype in _AUDIO_TYPES:
+        return True
+    if objtype in _PLAIN_TYPES:
+        return False
+    return (isinstance(obj, PyoObject) or
+            getattr(obj, "stream", _SENTINEL) is not _SENTINEL)
 
 def isTableObject(obj):
     "Return True if the argument is a table object."
-    return isinstance(obj, PyoTableObject) or hasattr(obj, "tablestream")
+    objtype = type(obj)
+    if objtype in _TABLE_TYPES:
+        return True
+    if objtype in _PLAIN_TYPES:
+        return False
+    return (isinstance(obj, PyoTableObject) or
+            getattr(obj, "tablestream", _SENTINEL) is not _SENTINEL)
 
 def isMatrixObject(obj):
     "Return True if the argument is a matrix object."
-    return isinstance(obj, PyoMatrixObject) or hasattr(obj, "matrixstream")
+    objtype = type(obj)
+    if objtype in _MATRIX_TYPES:
+        return True
+    if objtype in _PLAIN_TYPES:
+        return False
+    return (isinstance(obj, PyoMatrixObject) or
+            getattr(obj, "matrixstream", _SENTINEL) is not _SENTINEL)
 
 def isPVObject(obj):
     "Return True if the argument is a PV object."
-    return isinstance(obj, PyoPVObject) or hasattr(obj, "pv_stream")
+    objtype = type(obj)
+    if objtype in _PV_TYPES:
+        return True
+    if objtype in _PLAIN_TYPES:
+        return False
+    return (isinstance(obj, PyoPVObject) or
+            getattr(obj, "pv_stream", _SENTINEL) is not _SENTINEL)
+
+# Builtin types accepted by the pyoArgsAssert format characters.
+_NONE_TYPE = type(None)
+_INT_TYPES = frozenset((int, long_t))
+_NUM_TYPES = frozenset((int, long_t, float))
+_NUM_OR_LIST = frozenset((list, int, long_t, float))
+_INT_OR_LIST = frozenset((list, int, long_t))
+_BOOL_TYPES = frozenset((bool, int, long_t))
+_BOOL_OR_LIST = frozenset((bool, list, int, long_t))
+_FLOAT_OR_LIST = frozenset((list, float))
+_STRING_TYPES = frozenset((bytes_t, unicode_t))
+_STR_OR_LIST = frozenset((list, bytes_t, unicode_t))
+_SEQ_TYPES = frozenset((list, tuple))
+_SEQ_OR_NONE = frozenset((list, tuple, _NONE_TYPE))
+
+# Argument validators used by pyoArgsAssert. Each one receives the type
+# of the argument and the argument itself and returns a description of
+# the expected type if the argument is invalid, otherwise None.
+def _check_O(argtype, arg):
+    if argtype not in _NUM_OR_LIST and not isAudioObject(arg):
+        return "float or PyoObject"
+
+def _check_o(argtype, arg):
+    if argtype is not list and not isAudioObject(arg):
+        return "PyoObject"
+
+def _check_T(argtype, arg):
+    if argtype is not float and argtype is not list and not isTableObject(arg):
+        return "float or PyoTableObject"
+
+def _check_t(argtype, arg):
+    if argtype is not list and not isTableObject(arg):
+        return "PyoTableObject"
+
+def _check_m(argtype, arg):
+    if argtype is not list and not isMatrixObject(arg):
+        return "PyoMatrixObject"
+
+def _check_p(argtype, arg):
+    if argtype is not list and not isPVObject(arg):
+        return "PyoPVObject"
+
+def _check_n(argtype, arg):
+    if argtype not in _NUM_OR_LIST:
+        return "any number"
+
+def _check_N(argtype, arg):
+    if argtype not in _NUM_TYPES:
+        return "any number - list not allowed"
+
+def _check_f(argtype, arg):
+    if argtype not in _FLOAT_OR_LIST:
+        return "float"
+
+def _check_F(argtype, arg):
+    if argtype is not float:
+        return "float - list not allowed"
+
+def _check_i(argtype, arg):
+    if argtype not in _INT_OR_LIST:
+        return "integer"
+
+def _check_I(argtype, arg):
+    if argtype not in _INT_TYPES:
+        return "integer - list not allowed"
+
+def _check_s(argtype, arg):
+    if argtype not in _STR_OR_LIST:
+        return "string"
+
+def _check_S(argtype, arg):
+    if argtype not in _STRING_TYPES:
+        return "string - list not allowed"
+
+def _check_b(argtype, arg):
+    if argtype not in _BOOL_OR_LIST:
+        return "boolean"
+
+def _check_B(argtype, arg):
+    if argtype not in _BOOL_TYPES:
+        return "boolean - list not allowed"
+
+def _check_l(argtype, arg):
+    if argtype is not list:
+        return "list"
+
+def _check_L(argtype, arg):
+    if argtype is not list and argtype is not _NONE_TYPE:
+        return "list or None"
+
+def _check_u(argtype, arg):
+    if argtype is not tuple:
+        return "tuple"
+
+def _check_x(argtype, arg):
+    if argtype not in _SEQ_TYPES:
+        return "list or tuple"
+
+def _check_c(argtype, arg):
+    if argtype not in _SEQ_OR_NONE and not callable(arg):
+        return "callable"
+
+def _check_C(argtype, arg):
+    if argtype is not _NONE_TYPE and not callable(arg):
+        return "callable - list not allowed"
+
+def _check_z(argtype, arg):
+    return None
+
+_VALIDATORS = {"O": _check_O, "o": _check_o, "T": _check_T, "t": _check_t,
+               "m": _check_m, "p": _check_p, "n": _check_n, "N": _check_N,
+               "f": _check_f, "F": _check_F, "i": _check_i, "I": _check_I,
+               "s": _check_s, "S": _check_S, "b": _check_b, "B": _check_B,
+               "l": _check_l, "L": _check_L, "u": _check_u, "x": _check_x,
+               "c": _check_c, "C": _check_C, "z": _check_z}
+
+# Format strings already seen by pyoArgsAssert -> tuple of
+# (position, validator) pairs. "z" (anything) positions are left out.
+_FORMAT_CACHE = {}
+
+def _compile_format(format):
+    validators = tuple((i, _VALIDATORS[c]) for i, c in enumerate(format)
+                       if c in _VALIDATORS and c != "z")
+    _FORMAT_CACHE[format] = validators
+    return validators
 
 def pyoArgsAssert(obj, format, *args):
     """
@@ -189,97 +360,29 @@ def pyoArgsAssert(obj, format, *args):
         *args: any
             Arguments passed to the object's method.
 
-    """
-    if sys.version_info[0] < 3:
-        # Python 2
-        longType = int
-    else:
-        # Python 3
-        # Not used in Python 3, ignore it
-        longType = None
+    The check is skipped when python runs with optimizations (-O).
 
-    i = 0
-    expected = ""
-    for i, arg in enumerate(args):
-        f = format[i]
-        argtype = type(arg)
-        if f == "O":
-            atypes = [list, int, longType, float]
-            if not isAudioObject(arg) and argtype not in atypes:
-                expected = "float or PyoObject"
-        elif f == "o":
-            if not isAudioObject(arg) and argtype not in [list]:
-                expected = "PyoObject"
-        elif f == "T":
-            if not isTableObject(arg) and argtype not in [float, list]:
-                expected = "float or PyoTableObject"
-        elif f == "t":
-            if not isTableObject(arg) and argtype not in [list]:
-                expected = "PyoTableObject"
-        elif f == "m":
-            if not isMatrixObject(arg) and argtype not in [list]:
-                expected = "PyoMatrixObject"
-        elif f == "p":
-            if not isPVObject(arg) and argtype not in [list]:
-                expected = "PyoPVObject"
-        elif f == "n":
-            if argtype not in [list, int, longType, float]:
-                expected = "any number"
-        elif f == "N":
-            if argtype not in [int, longType, float]:
-                expected = "any number - list not allowed"
-        elif f == "f":
-            if argtype not in [list, float]:
-                expected = "float"
-        elif f == "F":
-            if argtype not in [float]:
-                expected = "float - list not allowed"
-        elif f == "i":
-            if argtype not in [list, int, longType]:
-                expected = "integer"
-        elif f == "I":
-            if argtype not in [int, longType]:
-                expected = "integer - list not allowed"
-        elif f == "s":
-            if argtype not in [list, bytes_t, unicode_t]:
-                expected = "string"
-        elif f == "S":
-            if argtype not in [bytes_t, unicode_t]:
-                expected = "string - list not allowed"
-        elif f == "b":
-            if argtype not in [bool, list, int, longType]:
-                expected = "boolean"
-        elif f == "B":
-            if argtype not in [bool, int, longType]:
-                expected = "boolean - list not allowed"
-        elif f == "l":
-            if argtype not in [list]:
-                expected = "list"
-        elif f == "L":
-            if argtype not in [list, type(None)]:
-                expected = "list or None"
-        elif f == "u":
-            if argtype not in [tuple]:
-                expected = "tuple"
-        elif f == "x":
-            if argtype not in [list, tuple]:
-                expected = "list or tuple"
-        elif f == "c":
-            if not callable(arg) and argtype not in [list, tuple, type(None)]:
-                expected = "callable"
-        elif f == "C":
-            if not callable(arg) and argtype not in [type(None)]:
-                expected = "callable - list not allowed"
-        elif f == "z":
-            pass
-
-        if expected:
+    """
+    if not __debug__:
+        return
+    validators = _FORMAT_CACHE.get(format)
+    if validators is None:
+        validators = _compile_format(format)
+    nargs = len(args)
+    if nargs > len(format):
+        raise IndexError('pyoArgsAssert format "%s" is shorter than the %d '
+                         'arguments given by "%s"' % (format, nargs,
+                                                      obj.__class__.__name__))
+    for i, check in validators:
+        if i >= nargs:
             break
-
-    if expected:
-        name = obj.__class__.__name__
-        err = 'bad argument at position %d to "%s" (%s expected, got %s)'
-        raise PyoArgumentTypeError(err % (i, name, expected, argtype))
+        arg = args[i]
+        argtype = type(arg)
+        expected = check(argtype, arg)
+        if expected is not None:
+            name = obj.__class__.__name__
+            err = 'bad argument at position %d to "%s" (%s expected, got %s)'
+            raise PyoArgumentTypeError(err % (i, name, expected, argtype))
 
 def convertStringToSysEncoding(strng):
     """
@@ -293,7 +396,7 @@ def convertStringToSysEncoding(strng):
             String to convert.
 
     """
-    if type(strng) not in [bytes_t, unicode_t]:
+    if type(strng) not in _STRING_TYPES:
         strng = strng.decode("utf-8")
     strng = strng.encode(sys.getfilesystemencoding())
     return strng
@@ -305,14 +408,20 @@ def convertArgsToLists(*args):
 
     """
     converted = []
+    append = converted.append
+    max_length = 0
     for i in args:
-        if isinstance(i, PyoObjectBase) or isinstance(i, list):
-            converted.append(i)
+        if type(i) is list or isinstance(i, (PyoObjectBase, list)):
+            length = len(i)
         else:
-            converted.append([i])
+            i = [i]
+            length = 1
+        append(i)
+        if length > max_length:
+            max_length = length
 
-    max_length = max(len(i) for i in converted)
-    return tuple(converted + [max_length])
+    append(max_length)
+    return tuple(converted)
 
 def wrap(arg, i):
     """
@@ -325,6 +434,49 @@ def wrap(arg, i):
     else:
         return x
 
+def _wrap_values(arg, n, dup=1):
+    """
+    Return the list `[wrap(arg, i // dup) for i in range(n)]`.
+
+    Items are dereferenced once and then cycled at C level, avoiding the
+    per-item modulo, division and function call of `wrap`.
+
+    """
+    if isinstance(arg, PyoObjectBase):
+        values = arg.getBaseObjects()
+    else:
+        values = [x[0] if isinstance(x, PyoObjectBase) else x for x in arg]
+    if dup > 1:
+        values = [x for x in values for _ in range(dup)]
+    return list(islice(cycle(values), n))
+
+def _broadcast_args(n, *args):
+    """
+    Return the list `[(wrap(a, i), wrap(b, i), ...) for i in range(n)]`
+    built from the argument lists `a`, `b`, ... given after `n`.
+
+    """
+    return list(zip(*[_wrap_values(arg, n) for arg in args]))
+
+def _read_data_file(path):
+    """
+    Return the list of lists of floats saved in a text file by the
+    write method of a table or a matrix.
+
+    """
+    import ast, json
+    f = open(path, "r")
+    text = f.read()
+    f.close()
+    try:
+        return json.loads(text)
+    except ValueError:
+        # Multi-line table files end their rows with a trailing comma.
+        return ast.literal_eval(text)
+
+# Matches the ">>> " or "... " prompt starting a docstring example line.
+_EXAMPLE_PROMPT_RE = re.compile(r"\s*(>>>|\.\.\.)( |$)")
+
 def example(cls, dur=5, toprint=True, double=False):
     """
     Execute the documentation example of the object given as an argument.
@@ -362,22 +514,20 @@ def example(cls, dur=5, toprint=True, double=False):
         print("There is no manual example for %s object." % cls.__name__)
         return
 
-    ex_lines = [l.lstrip("    ") for l in lines if ">>>" in l or "..." in l]
     if hasattr(builtins, 'pyo_use_double') or double:
-        ex = "import time\nfrom pyo64 import *\n"
+        parts = ["import time", "from pyo64 import *"]
     else:
-        ex = "import time\nfrom pyo import *\n"
-    for line in ex_lines:
-        if ">>>" in line:
-            line = line.lstrip(">>> ")
-        if "..." in line:
-            line = "    " +  line.lstrip("... ")
-        ex += line + "\n"
-
-    ex += "time.sleep(%f)\ns.stop()\ntime.sleep(0.25)\ns.shutdown()\n" % dur
-    f = tempfile.NamedTemporaryFile(delete=False)
+        parts = ["import time", "from pyo import *"]
+    for line in lines:
+        prompt = _EXAMPLE_PROMPT_RE.match(line)
+        if prompt is not None:
+            parts.append(line[prompt.end():])
+
+    parts.append("time.sleep(%f)\ns.stop()\ntime.sleep(0.25)\ns.shutdown()" % dur)
+    ex = "\n".join(parts) + "\n"
     if toprint:
-        f.write(tobytes('print("""\n%s\n""")\n' % ex))
+        ex = 'print("""\n%s\n""")\n%s' % (ex, ex)
+    f = tempfile.NamedTemporaryFile(delete=False)
     f.write(tobytes(ex))
     f.close()
     executable = sys.executable
@@ -385,14 +535,103 @@ def example(cls, dur=5, toprint=True, double=False):
         executable = "python"
     call([executable, f.name])
 
-def removeExtraDecimals(x):
-    "Return a floating-point value as a string with only two digits."
+def _format_default_float(x):
+    return "=%.2f" % x
+
+def _format_default_string(x):
+    return '="%s"' % x
+
+def _format_default_other(x):
     if isinstance(x, float):
         return "=%.2f" % x
-    elif type(x) in [bytes_t, unicode_t]:
-        return '="%s"' % x
+    return "=" + str(x)
+
+# removeExtraDecimals formatters, keyed by the exact type of the value.
+_DEFAULT_FORMATTERS = {float: _format_default_float,
+                       bytes_t: _format_default_string,
+                       unicode_t: _format_default_string}
+
+def removeExtraDecimals(x):
+    "Return a floating-point value as a string with only two digits."
+    return _DEFAULT_FORMATTERS.get(type(x), _format_default_other)(x)
+
+_INIT_ARGSPEC_CACHE = {}
+
+def _get_init_argspec(cls):
+    """
+    Return the (args, varargs, varkw, defaults) tuple of a class __init__.
+
+    Results are cached per class. Raises TypeError if `cls` doesn't
+    define its __init__ method in python.
+
+    """
+    try:
+        return _INIT_ARGSPEC_CACHE[cls]
+    except KeyError:
+        pass
+    init = getattr(cls, "__init__")
+    init = getattr(init, "__func__", init)
+    if not inspect.isfunction(init):
+        raise TypeError("%s has no python __init__ method." % cls)
+    if sys.version_info[0] < 3:
+        spec = tuple(inspect.getargspec(init))
     else:
-        return "=" + str(x)
+        spec = tuple(inspect.getfullargspec(init)[:4])
+    _INIT_ARGSPEC_CACHE[cls] = spec
+    return spec
+
+_CTOR_ATTRS_CACHE = {}
+
+def _get_ctor_attrs(cls):
+    """
+    Return the names of the __init__ arguments of a class that are also
+    attributes of the class, as a tuple. Results are cached per class.
+
+    """
+    try:
+        return _CTOR_ATTRS_CACHE[cls]
+    except KeyError:
+        pass
+    args = _get_init_argspec(cls)[0]
+    attrs = tuple(a for a in args if a != "self" and hasattr(cls, a))
+    _CTOR_ATTRS_CACHE[cls] = attrs
+    return attrs
+
+_PYO_CLASS_CACHE = {}
+
+def _get_pyo_class(cls):
+    """
+    Return the class exported by the pyo module under the name of `cls`.
+    Results are cached per class.
+
+    """
+    try:
+        return _PYO_CLASS_CACHE[cls]
+    except KeyError:
+        pass
+    ref = getattr(current_pyo, cls.__name__)
+    _PYO_CLASS_CACHE[cls] = ref
+    return ref
+
+def _format_init_args(args, varargs, varkw, defaults):
+    "Return the arguments of an init line, without `self`, as a string."
+    if args and args[0] == "self":
+        args = args[1:]
+    defaults = defaults or ()
+    first_default = len(args) - len(defaults)
+    specs = []
+    for i, arg in enumerate(args):
+        if i >= first_default:
+            arg += removeExtraDecimals(defaults[i - first_default])
+        specs.append(arg)
+    if varargs is not None:
+        specs.append("*" + varargs)
+    if varkw is not None:
+        specs.append("**" + varkw)
+    return "(" + ", ".join(specs) + ")"
+
+# Init lines already computed by class_args, keyed by class or function.
+_CLASS_ARGS_CACHE = {}
 
 def class_args(cls):
     """
@@ -410,24 +649,19 @@ def class_args(cls):
     >>> 'Sine(freq=1000, phase=0, mul=1, add=0)'
 
     """
+    try:
+        return _CLASS_ARGS_CACHE[cls]
+    except KeyError:
+        pass
     name = cls.__name__
     try:
         # Try for a class __init__ function
-        init = getattr(cls, "__init__")
-        arg, varargs, varkw, defaults = inspect.getargspec(init)
-        arg = inspect.formatargspec(arg, varargs, varkw, defaults,
-                                    formatvalue=removeExtraDecimals)
-        arg = arg.replace("self, ", "")
-        return name + arg
+        line = name + _format_init_args(*_get_init_argspec(cls))
     except TypeError:
-        try:
-            # Try for a function
-            if name in FUNCTIONS_INIT_LINES:
-                return FUNCTIONS_INIT_LINES[name]
-        except:
-            print("class_args was unable to retrieve the "
-                  "init line of the object as an argument.")
-        return ""
+        # Try for a function
+        line = FUNCTIONS_INIT_LINES.get(name, "")
+    _CLASS_ARGS_CACHE[cls] = line
+    return line
 
 def getVersion():
     """
@@ -445,6 +679,10 @@ def getVersion():
     major, minor, rev = PYO_VERSION.split('.')
     return (int(major), int(minor), int(rev))
 
+# Parses the lines printed by pa_list_host_apis().
+_HOST_API_RE = re.compile(r"name: (.*?), num devices: -?\d+, "
+                          r"default in: (-?\d+), default out: (-?\d+)")
+
 def pa_get_default_devices_from_host(host):
     """
     Returns the default input and output devices for a given audio host.
@@ -464,78 +702,67 @@ def pa_get_default_devices_from_host(host):
     Return: (default_input_device, default_output_device)
 
     """
-    host_default_in = pa_get_default_input()
-    host_default_out = pa_get_default_output()
-
     # Retrieve host apis infos.
-    tempfile = os.path.join(os.path.expanduser("~"), "pa_retrieve_host_apis")
-    with open(tempfile, "w") as f:
-        with f as sys.stdout:
-            pa_list_host_apis()
-        sys.stdout = sys.__stdout__
-
-    with open(tempfile, "r") as f:
-        lines = f.readlines()
-
-    os.remove(tempfile)
-
-    # Build the list of currently available hosts.
-    host_names = []
-    for line in lines:
-        p1 = line.find("name: ") + 6
-        p2 = line.find(",", p1+1)
-        host_names.append(line[p1:p2])
+    stdout = sys.stdout
+    sys.stdout = output = StringIO()
+    try:
+        pa_list_host_apis()
+    finally:
+        sys.stdout = stdout
+    hosts = [(name.lower(), int(default_in), int(default_out)) for
+             name, default_in, default_out in
+             _HOST_API_RE.findall(output.getvalue())]
 
     # Search for the desired host.
-    found = False
-    for line in lines:
-        if host.lower() in line.lower():
-            splitted = line.replace("\n", "").split(", ")
-            attributes = [x.split(": ") for x in splitted]
-            found = True
-            break
+    lhost = host.lower()
+    for name, default_in, default_out in hosts:
+        if lhost in name:
+            return default_in, default_out
 
     # If not found, return portaudio default values.
-    if not found:
-        print("Pyo can't find audio host '%s'. Currently available hosts are:" % host)
-        for host in host_names:
-            print("    %s" % host.lower())
-        return host_default_in, host_default_out
+    print("Pyo can't find audio host '%s'. Currently available hosts are:" % host)
+    for name, _, _ in hosts:
+        print("    %s" % name)
+    return pa_get_default_input(), pa_get_default_output()
+
+def _weak_method_ref(x):
+    if getattr(x, "__self__", None) is not None:
+        return WeakMethod(x)
+    return x
 
-    # If found, search default device indexes.
-    for attribute in attributes:
-        if attribute[0] == "default in":
-            host_default_in = int(attribute[1])
-        elif attribute[0] == "default out":
-            host_default_out = int(attribute[1])
+def _weak_method_ref_seq(x):
+    return [_weak_method_ref(y) for y in x]
 
-    return host_default_in, host_default_out
+# getWeakMethodRef handlers, keyed by the exact type of the argument.
+_WEAK_METHOD_REF_DISPATCH = {list: _weak_method_ref_seq,
+                             tuple: _weak_method_ref_seq}
 
 def getWeakMethodRef(x):
     "Return a callable object as a weak method reference."
-    if type(x) in [list, tuple]:
-        tmp = []
-        for y in x:
-            if hasattr(y, "__self__"):
-                y = WeakMethod(y)
-            tmp.append(y)
-        x = tmp
-    else:
-        if hasattr(x, "__self__"):
-            x = WeakMethod(x)
-    return x
+    return _WEAK_METHOD_REF_DISPATCH.get(type(x), _weak_method_ref)(x)
 
 class WeakMethod(object):
     """A callable object. Takes one argument to init: 'object.method'.
     Once created, call this object -- MyWeakMethod() --
     and pass args/kwargs as you normally would.
     """
+    __slots__ = ("target", "method", "isMethod", "__weakref__")
+
     def __new__(cls, callobj):
-        if callable(callobj):
-            return super(WeakMethod, cls).__new__(cls)
+        if not callable(callobj):
+            return None
+        if cls is WeakMethod:
+            # Pick the call path once, instead of testing it on every call.
+            if hasattr(callobj, "__func__"):
+                cls = _WeakBoundMethod
+            else:
+                cls = _WeakCallable
+        return super(WeakMethod, cls).__new__(cls)
 
     def __init__(self, callobj):
-        if hasattr(callobj, "__self__"):
+        # Bound builtin methods have __self__ but no __func__, they are
+        # called directly like any other callable.
+        if hasattr(callobj, "__func__"):
             self.target = proxy(callobj.__self__)
             self.method = proxy(callobj.__func__)
             self.isMethod = True
@@ -547,8 +774,21 @@ class WeakMethod(object):
         """Call the method with args and kwargs as needed."""
         if self.isMethod:
             return self.method(self.target, *args, **kwargs)
-        else:
-            return self.method(*args, **kwargs)
+        return self.method(*args, **kwargs)
+
+class _WeakBoundMethod(WeakMethod):
+    "WeakMethod wrapping a bound method."
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs):
+        return self.method(self.target, *args, **kwargs)
+
+class _WeakCallable(WeakMethod):
+    "WeakMethod wrapping any other callable."
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs):
+        return self.method(*args, **kwargs)
 
 ######################################################################
 ### PyoObjectBase -> abstract class for pyo objects
@@ -579,6 +819,14 @@ class PyoObjectBase(object):
     # descriptions of the object. Subclasses need to set this.
     _STREAM_TYPE = ''
 
+    def __init_subclass__(cls, **kwargs):
+        # Python 3.6+ only. Registers the class for the fast type checks
+        # done in isAudioObject, isTableObject, isMatrixObject and isPVObject.
+        super(PyoObjectBase, cls).__init_subclass__(**kwargs)
+        registry = _STREAM_TYPE_REGISTRY.get(cls._STREAM_TYPE)
+        if registry is not None:
+            registry.add(cls)
+
     def __init__(self):
         self._base_objs = []
         self._trig_objs = None
@@ -598,15 +846,14 @@ class PyoObjectBase(object):
         and the current status of the object's attributes.
 
         """
-        attrs = dir(self)
-        pp = '< Instance of %s class >' % self.__class__.__name__
-        pp += '\n-----------------------------'
-        pp += '\nNumber of %s streams: %d' % (self._STREAM_TYPE, len(self))
-        pp += '\n--- Attributes ---'
-        for attr in attrs:
-            pp += '\n' + attr + ': ' + str(getattr(self, attr))
-        pp += '\n-----------------------------'
-        return pp
+        lines = ['< Instance of %s class >' % self.__class__.__name__,
+                 '-----------------------------',
+                 'Number of %s streams: %d' % (self._STREAM_TYPE, len(self)),
+                 '--- Attributes ---']
+        lines.extend('%s: %s' % (attr, getattr(self, attr))
+                     for attr in dir(self))
+        lines.append('-----------------------------')
+        return '\n'.join(lines)
 
     def getBaseObjects(self):
         """
@@ -653,17 +900,23 @@ class PyoObjectBase(object):
         return self.__next__()
 
     def __getitem__(self, i):
-        if i == 'trig':
+        itype = type(i)
+        if itype is int:
+            base_objs = self._base_objs
+            if i < len(base_objs):
+                return base_objs[i]
+        elif itype is slice:
+            return self._base_objs[i]
+        elif i == 'trig':
             return self._trig_objs
-        if type(i) == slice or i < len(self._base_objs):
+        elif itype not in _STRING_TYPES and i < len(self._base_objs):
             return self._base_objs[i]
+        if itype in _STRING_TYPES:
+            args = (self.__class__.__name__, i)
+            print("Object %s has no stream named '%s'!" % args)
         else:
-            if type(i) in [bytes_t, unicode_t]:
-                args = (self.__class__.__name__, i)
-                print("Object %s has no stream named '%s'!" % args)
-            else:
-                args = (self._STREAM_TYPE, self.__class__.__name__)
-                print("'i' too large in slicing %s object %s!" % args)
+            args = (self._STREAM_TYPE, self.__class__.__name__)
+            print("'i' too large in slicing %s object %s!" % args)
 
     def __len__(self):
         return len(self._base_objs)
@@ -672,10 +925,7 @@ class PyoObjectBase(object):
         return '< Instance of %s class >' % self.__class__.__name__
 
     def __dir__(self):
-        init = getattr(self.__class__, "__init__")
-        args, _, _, _ = inspect.getargspec(init)
-        args = [a for a in args if hasattr(self.__class__, a) and a != "self"]
-        return args
+        return list(_get_ctor_attrs(self.__class__))
 
 ######################################################################
 ### PyoObject -> base class for pyo sound objects
@@ -758,27 +1008,36 @@ class PyoObject(PyoObjectBase):
         self._base_players = None
 
     def __add__(self, x):
-        x, lmax = convertArgsToLists(x)
-        if self.__len__() >= lmax:
-            _add_dummy = Dummy([obj + wrap(x, i//self._op_duplicate) \
-                                for i, obj in enumerate(self._base_objs)])
+        base = self._base_objs
+        if type(x) in _NUM_TYPES:
+            _add_dummy = Dummy(obj + x for obj in base)
         else:
-            if isinstance(x, PyoObject):
+            nb = len(base)
+            x, lmax = convertArgsToLists(x)
+            if nb >= lmax:
+                values = _wrap_values(x, nb, self._op_duplicate)
+                _add_dummy = Dummy(obj + y for obj, y in zip(base, values))
+            elif isinstance(x, PyoObject):
                 _add_dummy = x + self
             else:
-                _add_dummy = Dummy([wrap(self._base_objs, i) + obj \
-                                    for i, obj in enumerate(x)])
+                _add_dummy = Dummy(wrap(base, i) + obj \
+                                   for i, obj in enumerate(x))
         self._keep_trace.append(_add_dummy)
         return _add_dummy
 
     def __radd__(self, x):
-        x, lmax = convertArgsToLists(x)
-        if self.__len__() >= lmax:
-            _add_dummy = Dummy([obj + wrap(x, i//self._op_duplicate) \
-                                for i, obj in enumerate(self._base_objs)])
+        base = self._base_objs
+        if type(x) in _NUM_TYPES:
+            _add_dummy = Dummy(obj + x for obj in base)
         else:
-            _add_dummy = Dummy([wrap(self._base_objs, i) + obj \
-                                for i, obj in enumerate(x)])
+            nb = len(base)
+            x, lmax = convertArgsToLists(x)
+            if nb >= lmax:
+                values = _wrap_values(x, nb, self._op_duplicate)
+                _add_dummy = Dummy(obj + y for obj, y in zip(base, values))
+            else:
+                _add_dummy = Dummy(wrap(base, i) + obj \
+                                   for i, obj in enumerate(x))
         self._keep_trace.append(_add_dummy)
         return _add_dummy
 
@@ -787,37 +1046,50 @@ class PyoObject(PyoObjectBase):
         return self
 
     def __sub__(self, x):
-        x, lmax = convertArgsToLists(x)
-        if self.__len__() >= lmax:
-            _add_dummy = Dummy([obj - wrap(x, i//self._op_duplicate) \
-                                for i, obj in enumerate(self._base_objs)])
+        base = self._base_objs
+        if type(x) in _NUM_TYPES:
+            _add_dummy = Dummy(obj - x for obj in base)
         else:
-            if isinstance(x, PyoObject):
-                _add_dummy = Dummy([wrap(self._base_objs, i) - wrap(x, i) \
-                                    for i in range(lmax)])
+            nb = len(base)
+            x, lmax = convertArgsToLists(x)
+            if nb >= lmax:
+                values = _wrap_values(x, nb, self._op_duplicate)
+                _add_dummy = Dummy(obj - y for obj, y in zip(base, values))
+            elif isinstance(x, PyoObject):
+                _add_dummy = Dummy(wrap(base, i) - wrap(x, i) \
+                                   for i in range(lmax))
             else:
-                _add_dummy = Dummy([wrap(self._base_objs, i) - obj \
-                                    for i, obj in enumerate(x)])
+                _add_dummy = Dummy(wrap(base, i) - obj \
+                                   for i, obj in enumerate(x))
         self._keep_trace.append(_add_dummy)
         return _add_dummy
 
     def __rsub__(self, x):
+        base = self._base_objs
+        nb = len(base)
         x, lmax = convertArgsToLists(x)
-        if self.__len__() >= lmax:
-            tmp = []
-            for i, obj in enumerate(self._base_objs):
-                sub_upsamp = Sig(wrap(x, i//self._op_duplicate))
-                self._keep_trace.append(sub_upsamp)
-                tmp.append(sub_upsamp - obj)
-            _add_dummy = Dummy(tmp)
+        upsamps = []
+        if nb >= lmax:
+            tmp = [None] * nb
+            dup = self._op_duplicate
+            # One upsampling Sig per distinct value of `x`.
+            cache = {}
+            for i, obj in enumerate(base):
+                k = (i // dup) % lmax
+                sub_upsamp = cache.get(k)
+                if sub_upsamp is None:
+                    sub_upsamp = cache[k] = Sig(wrap(x, k))
+                    upsamps.append(sub_upsamp)
+                tmp[i] = sub_upsamp - obj
         else:
-            tmp = []
+            tmp = [None] * lmax
             for i, obj in enumerate(x):
                 sub_upsamp = Sig(obj)
-                self._keep_trace.append(sub_upsamp)
-                tmp.append(sub_upsamp - wrap(self._base_objs, i))
-            _add_dummy = Dummy(tmp)
-        self._keep_trace.append(_add_dummy)
+                upsamps.append(sub_upsamp)
+                tmp[i] = sub_upsamp - wrap(base, i)
+        _add_dummy = Dummy(tmp)
+        upsamps.append(_add_dummy)
+        self._keep_trace.extend(upsamps)
         return _add_dummy
 
     def __isub__(self, x):
@@ -825,27 +1097,36 @@ class PyoObject(PyoObjectBase):
         return self
 
     def __mul__(self, x):
-        x, lmax = convertArgsToLists(x)
-        if self.__len__() >= lmax:
-            _mul_dummy = Dummy([obj * wrap(x, i//self._op_duplicate) \
-                                for i, obj in enumerate(self._base_objs)])
+        base = self._base_objs
+        if type(x) in _NUM_TYPES:
+            _mul_dummy = Dummy(obj * x for obj in base)
         else:
-            if isinstance(x, PyoObject):
+            nb = len(base)
+            x, lmax = convertArgsToLists(x)
+            if nb >= lmax:
+                values = _wrap_values(x, nb, self._op_duplicate)
+                _mul_dummy = Dummy(obj * y for obj, y in zip(base, values))
+            elif isinstance(x, PyoObject):
                 _mul_dummy = x * self
             else:
-                _mul_dummy = Dummy([wrap(self._base_objs, i) * obj \
-                                    for i, obj in enumerate(x)])
+                _mul_dummy = Dummy(wrap(base, i) * obj \
+                                   for i, obj in enumerate(x))
         self._keep_trace.append(_mul_dummy)
         return _mul_dummy
 
     def __rmul__(self, x):
-        x, lmax = convertArgsToLists(x)
-        if self.__len__() >= lmax:
-            _mul_dummy = Dummy([obj * wrap(x, i//self._op_duplicate) \
-                                for i, obj in enumerate(self._base_objs)])
+        base = self._base_objs
+        if type(x) in _NUM_TYPES:
+            _mul_dummy = Dummy(obj * x for obj in base)
         else:
-            _mul_dummy = Dummy([wrap(self._base_objs, i) * obj \
-                                for i, obj in enumerate(x)])
+            nb = len(base)
+            x, lmax = convertArgsToLists(x)
+            if nb >= lmax:
+                values = _wrap_values(x, nb, self._op_duplicate)
+                _mul_dummy = Dummy(obj * y for obj, y in zip(base, values))
+            else:
+                _mul_dummy = Dummy(wrap(base, i) * obj \
+                                   for i, obj in enumerate(x))
         self._keep_trace.append(_mul_dummy)
         return _mul_dummy
 
@@ -863,37 +1144,50 @@ class PyoObject(PyoObjectBase):
         return self.__idiv__(x)
 
     def __div__(self, x):
-        x, lmax = convertArgsToLists(x)
-        if self.__len__() >= lmax:
-            _mul_dummy = Dummy([obj / wrap(x, i//self._op_duplicate) \
-                                for i, obj in enumerate(self._base_objs)])
+        base = self._base_objs
+        if type(x) in _NUM_TYPES:
+            _mul_dummy = Dummy(obj / x for obj in base)
         else:
-            if isinstance(x, PyoObject):
-                _mul_dummy = Dummy([wrap(self._base_objs, i) / wrap(x, i) \
-                                    for i in range(lmax)])
+            nb = len(base)
+            x, lmax = convertArgsToLists(x)
+            if nb >= lmax:
+                values = _wrap_values(x, nb, self._op_duplicate)
+                _mul_dummy = Dummy(obj / y for obj, y in zip(base, values))
+            elif isinstance(x, PyoObject):
+                _mul_dummy = Dummy(wrap(base, i) / wrap(x, i) \
+                                   for i in range(lmax))
             else:
-                _mul_dummy = Dummy([wrap(self._base_objs, i) / obj \
-                                    for i, obj in enumerate(x)])
+                _mul_dummy = Dummy(wrap(base, i) / obj \
+                                   for i, obj in enumerate(x))
         self._keep_trace.append(_mul_dummy)
         return _mul_dummy
 
     def __rdiv__(self, x):
+        base = self._base_objs
+        nb = len(base)
         x, lmax = convertArgsToLists(x)
-        if self.__len__() >= lmax:
-            tmp = []
-            for i, obj in enumerate(self._base_objs):
-                div_upsamp = Sig(wrap(x, i//self._op_duplicate))
-                self._keep_trace.append(div_upsamp)
-                tmp.append(div_upsamp / obj)
-            _mul_dummy = Dummy(tmp)
+        upsamps = []
+        if nb >= lmax:
+            tmp = [None] * nb
+            dup = self._op_duplicate
+            # One upsampling Sig per distinct value of `x`.
+            cache = {}
+            for i, obj in enumerate(base):
+                k = (i // dup) % lmax
+                div_upsamp = cache.get(k)
+                if div_upsamp is None:
+                    div_upsamp = cache[k] = Sig(wrap(x, k))
+                    upsamps.append(div_upsamp)
+                tmp[i] = div_upsamp / obj
         else:
-            tmp = []
+            tmp = [None] * lmax
             for i, obj in enumerate(x):
                 div_upsamp = Sig(obj)
-                self._keep_trace.append(div_upsamp)
-                tmp.append(div_upsamp / wrap(self._base_objs, i))
-            _mul_dummy = Dummy(tmp)
-        self._keep_trace.append(_mul_dummy)
+                upsamps.append(div_upsamp)
+                tmp[i] = div_upsamp / wrap(base, i)
+        _mul_dummy = Dummy(tmp)
+        upsamps.append(_mul_dummy)
+        self._keep_trace.extend(upsamps)
         return _mul_dummy
 
     def __idiv__(self, x):
@@ -915,28 +1209,22 @@ class PyoObject(PyoObjectBase):
         return self._zeros - self
 
     def __lt__(self, x):
-        return self.__do_comp__(comp=x, mode="<")
+        return False if x is None else Compare(self, x, "<")
 
     def __le__(self, x):
-        return self.__do_comp__(comp=x, mode="<=")
+        return False if x is None else Compare(self, x, "<=")
 
     def __eq__(self, x):
-        return self.__do_comp__(comp=x, mode="==")
+        return False if x is None else Compare(self, x, "==")
 
     def __ne__(self, x):
-        return self.__do_comp__(comp=x, mode="!=", default=True)
+        return True if x is None else Compare(self, x, "!=")
 
     def __gt__(self, x):
-        return self.__do_comp__(comp=x, mode=">")
+        return False if x is None else Compare(self, x, ">")
 
     def __ge__(self, x):
-        return self.__do_comp__(comp=x, mode=">=")
-
-    def __do_comp__(self, comp, mode, default=False):
-        if comp is None:
-            return default
-        else:
-            return Compare(self, comp=comp, mode=mode)
+        return False if x is None else Compare(self, x, ">=")
 
     def isPlaying(self, all=False):
         """
@@ -1027,18 +1315,21 @@ class PyoObject(PyoObjectBase):
         """
         pyoArgsAssert(self, "nn", dur, delay)
         dur, delay, lmax = convertArgsToLists(dur, delay)
-        if self._trig_objs is not None:
-            if isinstance(self._trig_objs, list):
+        trig_objs = self._trig_objs
+        if trig_objs is not None:
+            if isinstance(trig_objs, list):
                 for i in range(lmax):
-                    for obj in self._trig_objs:
-                        obj.play(wrap(dur, i), wrap(delay, i))
+                    dur_i, delay_i = wrap(dur, i), wrap(delay, i)
+                    for obj in trig_objs:
+                        obj.play(dur_i, delay_i)
             else:
-                self._trig_objs.play(dur, delay)
-        if self._base_players is not None:
-            [obj.play(wrap(dur, i), wrap(delay, i)) \
-             for i, obj in enumerate(self._base_players)]
-        [obj.play(wrap(dur, i), wrap(delay, i)) \
-         for i, obj in enumerate(self._base_objs)]
+                trig_objs.play(dur, delay)
+        players = self._base_players
+        if players is not None:
+            for obj, d, dl in zip(players, cycle(dur), cycle(delay)):
+                obj.play(d, dl)
+        for obj, d, dl in zip(self._base_objs, cycle(dur), cycle(delay)):
+            obj.play(d, dl)
         return self
 
     def out(self, chnl=0, inc=1, dur=0, delay=0):
@@ -1075,27 +1366,35 @@ class PyoObject(PyoObjectBase):
         """
         pyoArgsAssert(self, "iInn", chnl, inc, dur, delay)
         dur, delay, lmax = convertArgsToLists(dur, delay)
-        if self._trig_objs is not None:
-            if isinstance(self._trig_objs, list):
+        trig_objs = self._trig_objs
+        if trig_objs is not None:
+            if isinstance(trig_objs, list):
                 for i in range(lmax):
-                    for obj in self._trig_objs:
-                        obj.play(wrap(dur, i), wrap(delay, i))
+                    dur_i, delay_i = wrap(dur, i), wrap(delay, i)
+                    for obj in trig_objs:
+                        obj.play(dur_i, delay_i)
             else:
-                self._trig_objs.play(dur, delay)
-        if self._base_players is not None:
-            [obj.play(wrap(dur, i), wrap(delay, i))
-             for i, obj in enumerate(self._base_players)]
+                trig_objs.play(dur, delay)
+        players = self._base_players
+        if players is not None:
+            for obj, d, dl in zip(players, cycle(dur), cycle(delay)):
+                obj.play(d, dl)
         if isinstance(chnl, list):
-            [obj.out(wrap(chnl, i), wrap(dur, i), wrap(delay, i)) \
-             for i, obj in enumerate(self._base_objs)]
+            for obj, ch, d, dl in zip(self._base_objs, cycle(chnl),
+                                      cycle(dur), cycle(delay)):
+                obj.out(ch, d, dl)
         else:
             if chnl < 0:
-                [obj.out(i*inc, wrap(dur, i), wrap(delay, i)) \
-                 for i, obj in enumerate(random.sample(self._base_objs,
-                                                       len(self._base_objs)))]
+                streams = list(self._base_objs)
+                random.shuffle(streams)
+                for i, (obj, d, dl) in enumerate(zip(streams, cycle(dur),
+                                                     cycle(delay))):
+                    obj.out(i*inc, d, dl)
             else:
-                [obj.out(chnl+i*inc, wrap(dur, i), wrap(delay, i)) \
-                 for i, obj in enumerate(self._base_objs)]
+                for i, (obj, d, dl) in enumerate(zip(self._base_objs,
+                                                     cycle(dur),
+                                                     cycle(delay))):
+                    obj.out(chnl+i*inc, d, dl)
         return self
 
     def stop(self):
@@ -1106,14 +1405,19 @@ class PyoObject(PyoObjectBase):
         creation.
 
         """
-        if self._trig_objs is not None:
-            if isinstance(self._trig_objs, list):
-                [obj.stop() for obj in self._trig_objs]
+        trig_objs = self._trig_objs
+        if trig_objs is not None:
+            if isinstance(trig_objs, list):
+                for obj in trig_objs:
+                    obj.stop()
             else:
-                self._trig_objs.stop()
-        if self._base_players is not None:
-            [obj.stop() for obj in self._base_players]
-        [obj.stop() for obj in self._base_objs]
+                trig_objs.stop()
+        players = self._base_players
+        if players is not None:
+            for obj in players:
+                obj.stop()
+        for obj in self._base_objs:
+            obj.stop()
         return self
 
     def mix(self, voices=1):
@@ -1156,15 +1460,41 @@ class PyoObject(PyoObjectBase):
         pyoArgsAssert(self, "nn", min, max)
         min, max, lmax = convertArgsToLists(min, max)
         if lmax > 1:
-            mul = [(wrap(max, i) - wrap(min, i)) * 0.5 for i in range(lmax)]
-            add = [(wrap(max, i) + wrap(min, i)) * 0.5 for i in range(lmax)]
+            bounds = list(zip(_wrap_values(min, lmax), _wrap_values(max, lmax)))
+            mul = [(hi - lo) * 0.5 for lo, hi in bounds]
+            add = [(hi + lo) * 0.5 for lo, hi in bounds]
         else:
             mul = (max[0] - min[0]) * 0.5
             add = (max[0] + min[0]) * 0.5
-        self.setMul(mul)
-        self.setAdd(add)
+        self._setMulAdd(mul, add)
         return self
 
+    def _setMulAdd(self, mul, add):
+        """
+        Replace the `mul` and `add` attributes in one pass over the streams.
+
+        Objects overriding setMul or setAdd are updated through them.
+
+        """
+        cls = self.__class__
+        for name in ("setMul", "setAdd"):
+            method = getattr(cls, name)
+            if getattr(method, "__func__", method) is not \
+               PyoObject.__dict__[name]:
+                self.setMul(mul)
+                self.setAdd(add)
+                return
+        self._mul = mul
+        self._add = add
+        mul, add, _ = convertArgsToLists(mul, add)
+        base = self._base_objs
+        nb = len(base)
+        dup = self._op_duplicate
+        for obj, m, a in zip(base, _wrap_values(mul, nb, dup),
+                             _wrap_values(add, nb, dup)):
+            obj.setMul(m)
+            obj.setAdd(a)
+
     def setMul(self, x):
         """
         Replace the `mul` attribute.
@@ -1178,8 +1508,10 @@ class PyoObject(PyoObjectBase):
         pyoArgsAssert(self, "O", x)
         self._mul = x
         x, _ = convertArgsToLists(x)
-        [obj.setMul(wrap(x, i // self._op_duplicate)) \
-         for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        values = _wrap_values(x, len(base), self._op_duplicate)
+        for obj, y in zip(base, values):
+            obj.setMul(y)
 
     def setAdd(self, x):
         """
@@ -1194,8 +1526,10 @@ class PyoObject(PyoObjectBase):
         pyoArgsAssert(self, "O", x)
         self._add = x
         x, _ = convertArgsToLists(x)
-        [obj.setAdd(wrap(x, i // self._op_duplicate)) \
-         for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        values = _wrap_values(x, len(base), self._op_duplicate)
+        for obj, y in zip(base, values):
+            obj.setAdd(y)
 
     def setSub(self, x):
         """
@@ -1210,8 +1544,10 @@ class PyoObject(PyoObjectBase):
         pyoArgsAssert(self, "O", x)
         self._add = x
         x, _ = convertArgsToLists(x)
-        [obj.setSub(wrap(x, i // self._op_duplicate)) \
-         for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        values = _wrap_values(x, len(base), self._op_duplicate)
+        for obj, y in zip(base, values):
+            obj.setSub(y)
 
     def setDiv(self, x):
         """
@@ -1226,8 +1562,10 @@ class PyoObject(PyoObjectBase):
         pyoArgsAssert(self, "O", x)
         self._mul = x
         x, _ = convertArgsToLists(x)
-        [obj.setDiv(wrap(x, i // self._op_duplicate)) \
-         for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        values = _wrap_values(x, len(base), self._op_duplicate)
+        for obj, y in zip(base, values):
+            obj.setDiv(y)
 
     def set(self, attr, value, port=0.025, callback=None):
         """
@@ -1255,11 +1593,10 @@ class PyoObject(PyoObjectBase):
         self._target_dict[attr] = value
         self._callback_dict[attr] = callback
         init = getattr(self, attr)
-        if attr in self._signal_dict:
-            if isinstance(self._signal_dict[attr], VarPort):
-                if self._signal_dict[attr].isPlaying():
-                    init = self._signal_dict[attr].get(True)
-                    self._signal_dict[attr].stop()
+        current = self._signal_dict.get(attr)
+        if isinstance(current, VarPort) and current.isPlaying():
+            init = current.get(True)
+            current.stop()
         self._signal_dict[attr] = VarPort(value, port, init,
                                           self._reset_from_set, attr)
         setattr(self, attr, self._signal_dict[attr])
@@ -1343,6 +1680,11 @@ class PyoTableObject(PyoObjectBase):
     """
 
     _STREAM_TYPE = 'table'
+    _view_suspended = False
+    _view_getsize = None
+    _view_update = None
+    _graph_getlength = None
+    _graph_update = None
 
     def __init__(self, size=0):
         PyoObjectBase.__init__(self)
@@ -1350,6 +1692,27 @@ class PyoTableObject(PyoObjectBase):
         self.viewFrame = None
         self.graphFrame = None
 
+    @contextmanager
+    def batch_edit(self):
+        """
+        Context manager deferring the display updates of the table.
+
+        refreshView() does nothing inside the `with` block, so edits made
+        there refresh the graphical display only once, when the block exits.
+
+        >>> with t.batch_edit():
+        ...     t.add(1).mul(0.5).pow(2)
+
+        """
+        suspended = self._view_suspended
+        self._view_suspended = True
+        try:
+            yield self
+        finally:
+            self._view_suspended = suspended
+            if not suspended:
+                self.refreshView()
+
     def save(self, path, format=0, sampletype=0, quality=0.4):
         """
         Writes the content of the table in an audio file.
@@ -1420,16 +1783,13 @@ class PyoTableObject(PyoObjectBase):
         if oneline:
             f.write(str([obj.getTable() for obj in self._base_objs]))
         else:
-            text = "["
+            tables = []
             for obj in self._base_objs:
-                text += "["
-                for i, val in enumerate(obj.getTable()):
-                    if (i % 8) == 0:
-                        text += "\n"
-                    text += str(val) + ", "
-                text += "]"
-            text += "]"
-            f.write(text)
+                values = [str(val) for val in obj.getTable()]
+                lines = ["\n" + ", ".join(values[i:i+8]) + ", " \
+                         for i in range(0, len(values), 8)]
+                tables.append("[" + "".join(lines) + "]")
+            f.write("[" + "".join(tables) + "]")
         f.close()
 
     def read(self, path):
@@ -1452,11 +1812,10 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "S", path)
-        f = open(path, "r")
-        f_list = eval(f.read())
+        f_list = _read_data_file(path)
         f_len = len(f_list)
-        f.close()
-        [obj.setData(f_list[i%f_len]) for i, obj in enumerate(self._base_objs)]
+        for i, obj in enumerate(self._base_objs):
+            obj.setData(f_list[i%f_len])
         self.refreshView()
 
     def getBuffer(self, chnl=0):
@@ -1496,7 +1855,8 @@ class PyoTableObject(PyoObjectBase):
         """
         pyoArgsAssert(self, "I", size)
         self._size = size
-        [obj.setSize(size) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.setSize(size)
         self.refreshView()
 
     def getSize(self, all=False):
@@ -1537,7 +1897,8 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "NI", value, pos)
-        [obj.put(value, pos) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.put(value, pos)
         self.refreshView()
 
     def get(self, pos):
@@ -1586,7 +1947,8 @@ class PyoTableObject(PyoObjectBase):
         Normalize table samples between -1 and 1.
 
         """
-        [obj.normalize() for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.normalize()
         self.refreshView()
         return self
 
@@ -1595,7 +1957,8 @@ class PyoTableObject(PyoObjectBase):
         Resets table samples to 0.0.
 
         """
-        [obj.reset() for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.reset()
         self.refreshView()
         return self
 
@@ -1604,7 +1967,8 @@ class PyoTableObject(PyoObjectBase):
         Filter out DC offset from the table's data.
 
         """
-        [obj.removeDC() for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.removeDC()
         self.refreshView()
         return self
 
@@ -1613,7 +1977,8 @@ class PyoTableObject(PyoObjectBase):
         Reverse the table's data in time.
 
         """
-        [obj.reverse() for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.reverse()
         self.refreshView()
         return self
 
@@ -1622,7 +1987,8 @@ class PyoTableObject(PyoObjectBase):
         Reverse the table's data in amplitude.
 
         """
-        [obj.invert() for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.invert()
         self.refreshView()
         return self
 
@@ -1631,7 +1997,8 @@ class PyoTableObject(PyoObjectBase):
         Positive rectification of the table's data.
 
         """
-        [obj.rectify() for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.rectify()
         self.refreshView()
         return self
 
@@ -1646,7 +2013,8 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "N", exp)
-        [obj.pow(exp) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.pow(exp)
         self.refreshView()
         return self
 
@@ -1663,7 +2031,8 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "NN", gpos, gneg)
-        [obj.bipolarGain(gpos, gneg) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.bipolarGain(gpos, gneg)
         self.refreshView()
         return self
 
@@ -1678,7 +2047,8 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "N", freq)
-        [obj.lowpass(freq) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.lowpass(freq)
         self.refreshView()
         return self
 
@@ -1693,7 +2063,8 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "N", dur)
-        [obj.fadein(dur) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.fadein(dur)
         self.refreshView()
         return self
 
@@ -1708,10 +2079,32 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "N", dur)
-        [obj.fadeout(dur) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.fadeout(dur)
         self.refreshView()
         return self
 
+    def _apply_elementwise(self, name, x):
+        """
+        Call the stream method `name` with the value(s) of `x`.
+
+        A flat list is given as is to every stream, a list of lists and
+        a PyoTableObject are spread over the streams.
+
+        """
+        base = self._base_objs
+        if isinstance(x, list):
+            if isinstance(x[0], list):
+                for i, obj in enumerate(base):
+                    getattr(obj, name)(wrap(x, i))
+            else:
+                for obj in base:
+                    getattr(obj, name)(x)
+        else:
+            x, _ = convertArgsToLists(x)
+            for i, obj in enumerate(base):
+                getattr(obj, name)(wrap(x, i))
+
     def add(self, x):
         """
         Performs addition on the table values.
@@ -1726,14 +2119,7 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "T", x)
-        if isinstance(x, list):
-            if isinstance(x[0], list):
-                [obj.add(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
-            else:
-                [obj.add(x) for obj in self._base_objs]
-        else:
-            x, _ = convertArgsToLists(x)
-            [obj.add(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        self._apply_elementwise("add", x)
         self.refreshView()
         return self
 
@@ -1751,14 +2137,7 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "T", x)
-        if isinstance(x, list):
-            if isinstance(x[0], list):
-                [obj.sub(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
-            else:
-                [obj.sub(x) for obj in self._base_objs]
-        else:
-            x, _ = convertArgsToLists(x)
-            [obj.sub(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        self._apply_elementwise("sub", x)
         self.refreshView()
         return self
 
@@ -1776,14 +2155,7 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "T", x)
-        if isinstance(x, list):
-            if isinstance(x[0], list):
-                [obj.mul(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
-            else:
-                [obj.mul(x) for obj in self._base_objs]
-        else:
-            x, _ = convertArgsToLists(x)
-            [obj.mul(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        self._apply_elementwise("mul", x)
         self.refreshView()
         return self
 
@@ -1809,8 +2181,8 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "tIII", table, srcpos, destpos, length)
-        [obj.copyData(table[i], srcpos,
-                      destpos, length) for i, obj in enumerate(self._base_objs)]
+        for i, obj in enumerate(self._base_objs):
+            obj.copyData(table[i], srcpos, destpos, length)
         self.refreshView()
 
     def rotate(self, pos):
@@ -1829,7 +2201,8 @@ class PyoTableObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "I", pos)
-        [obj.rotate(pos) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.rotate(pos)
         self.refreshView()
 
     def copy(self):
@@ -1837,21 +2210,24 @@ class PyoTableObject(PyoObjectBase):
         Returns a deep copy of the object.
 
         """
-        args = [getattr(self, att) for att in self.__dir__()]
-        if self.__class__.__name__ == "SndTable":
+        cls = self.__class__
+        args = [getattr(self, att) for att in _get_ctor_attrs(cls)]
+        ctor = _get_pyo_class(cls)
+        if cls.__name__ == "SndTable":
             _size = self.getSize()
             if not isinstance(_size, list):
                 _size = [_size]
             _chnls = len(self._base_objs)
             args[0] = None
             args.append(_chnls)
-            newtable = getattr(current_pyo, self.__class__.__name__)(*args)
+            newtable = ctor(*args)
             baseobjs = newtable.getBaseObjects()
-            [obj.setSize(_size[i%len(_size)]) for i, obj in enumerate(baseobjs)]
-            [obj.copy(self[i]) for i, obj in enumerate(newtable.getBaseObjects())]
+            for i, obj in enumerate(baseobjs):
+                obj.setSize(_size[i%len(_size)])
         else:
-            newtable = getattr(current_pyo, self.__class__.__name__)(*args)
-            [obj.copy(self[i]) for i, obj in enumerate(newtable.getBaseObjects())]
+            newtable = ctor(*args)
+        for i, obj in enumerate(newtable.getBaseObjects()):
+            obj.copy(self[i])
         return newtable
 
     def view(self, title="Table waveform", wxnoserver=False):
@@ -1877,9 +2253,21 @@ class PyoTableObject(PyoObjectBase):
 
     def _setViewFrame(self, frame):
         self.viewFrame = frame
+        # Bound methods used by refreshView, resolved once per frame.
+        panel = getattr(frame, "wavePanel", None)
+        if panel is not None:
+            self._view_getsize = panel.GetSize
+            self._view_update = frame.update
+        else:
+            self._view_getsize = self._view_update = None
 
     def _setGraphFrame(self, frame):
         self.graphFrame = frame
+        if frame is not None:
+            self._graph_getlength = frame.getLength
+            self._graph_update = frame.update
+        else:
+            self._graph_getlength = self._graph_update = None
 
     def _get_current_data(self):
         # Thid method must be override by children.
@@ -1890,19 +2278,22 @@ class PyoTableObject(PyoObjectBase):
         Updates the graphical display of the table, if applicable.
 
         """
-        if self.viewFrame is not None:
-            size = self.viewFrame.wavePanel.GetSize()
+        if self._view_suspended:
+            return
+        getsize = self._view_getsize
+        if getsize is not None:
+            size = getsize()
             samples = self._base_objs[0].getViewTable((size[0], size[1]))
-            self.viewFrame.update(samples)
-        if self.graphFrame is not None:
+            self._view_update(samples)
+        getlength = self._graph_getlength
+        if getlength is not None:
             data = self._get_current_data()
-            length = len(data)
-            flength = self.graphFrame.getLength()
-            if length < flength:
-                data = data + [0] * (flength - length)
-            elif length > flength:
-                data = data[:flength]
-            self.graphFrame.update(data)
+            flength = getlength()
+            if len(data) != flength:
+                # Pad with zeros or truncate in a single pass. The grapher
+                # keeps and edits the list it gets, so it must be a new one.
+                data = list(islice(chain(data, repeat(0)), flength))
+            self._graph_update(data)
 
     @property
     def size(self):
@@ -1929,6 +2320,7 @@ class PyoMatrixObject(PyoObjectBase):
     """
 
     _STREAM_TYPE = 'matrix'
+    _view_update = None
 
     def __init__(self):
         self._size = (0, 0)
@@ -1949,8 +2341,15 @@ class PyoMatrixObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "S", path)
+        # Streams are written one at a time, so only one matrix stream is
+        # held as text at once. The output matches str() of the full list.
         f = open(path, "w")
-        f.write(str([obj.getData() for obj in self._base_objs]))
+        f.write("[")
+        for i, obj in enumerate(self._base_objs):
+            if i > 0:
+                f.write(", ")
+            f.write(str(obj.getData()))
+        f.write("]")
         f.close()
 
     def read(self, path):
@@ -1975,11 +2374,10 @@ class PyoMatrixObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "S", path)
-        f = open(path, "r")
-        f_list = eval(f.read())
+        f_list = _read_data_file(path)
         f_len = len(f_list)
-        f.close()
-        [obj.setData(f_list[i%f_len]) for i, obj in enumerate(self._base_objs)]
+        for i, obj in enumerate(self._base_objs):
+            obj.setData(f_list[i%f_len])
 
     def getSize(self):
         """
@@ -1993,7 +2391,8 @@ class PyoMatrixObject(PyoObjectBase):
         Normalize matrix samples between -1 and 1.
 
         """
-        [obj.normalize() for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.normalize()
         return self
 
     def blur(self):
@@ -2001,7 +2400,8 @@ class PyoMatrixObject(PyoObjectBase):
         Apply a simple gaussian blur on the matrix.
 
         """
-        [obj.blur() for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.blur()
 
     def boost(self, min=-1.0, max=1.0, boost=0.01):
         """
@@ -2018,7 +2418,8 @@ class PyoMatrixObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "NNN", min, max, boost)
-        [obj.boost(min, max, boost) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.boost(min, max, boost)
 
     def put(self, value, x=0, y=0):
         """
@@ -2039,7 +2440,8 @@ class PyoMatrixObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "NII", value, x, y)
-        [obj.put(value, x, y) for obj in self._base_objs]
+        for obj in self._base_objs:
+            obj.put(value, x, y)
 
     def get(self, x, y):
         """
@@ -2086,15 +2488,16 @@ class PyoMatrixObject(PyoObjectBase):
 
     def _setViewFrame(self, frame):
         self.viewFrame = frame
+        self._view_update = frame.update if frame is not None else None
 
     def refreshView(self):
         """
         Updates the graphical display of the matrix, if applicable.
 
         """
-        if self.viewFrame is not None:
-            samples = self._base_objs[0].getImageData()
-            self.viewFrame.update(samples)
+        update = self._view_update
+        if update is not None:
+            update(self._base_objs[0].getImageData())
 
 ######################################################################
 ### PyoObject -> base class for pyo phase vocoder objects
@@ -2158,13 +2561,15 @@ class PyoPVObject(PyoObjectBase):
         """
         pyoArgsAssert(self, "nn", dur, delay)
         dur, delay, _ = convertArgsToLists(dur, delay)
-        if self._trig_objs is not None:
-            self._trig_objs.play(dur, delay)
-        if self._base_players is not None:
-            [obj.play(wrap(dur, i), wrap(delay, i)) \
-             for i, obj in enumerate(self._base_players)]
-        [obj.play(wrap(dur, i), wrap(delay, i)) \
-         for i, obj in enumerate(self._base_objs)]
+        trig_objs = self._trig_objs
+        if trig_objs is not None:
+            trig_objs.play(dur, delay)
+        players = self._base_players
+        if players is not None:
+            for obj, d, dl in zip(players, cycle(dur), cycle(delay)):
+                obj.play(d, dl)
+        for obj, d, dl in zip(self._base_objs, cycle(dur), cycle(delay)):
+            obj.play(d, dl)
         return self
 
     def stop(self):
@@ -2175,11 +2580,15 @@ class PyoPVObject(PyoObjectBase):
         creation.
 
         """
-        if self._trig_objs is not None:
-            self._trig_objs.stop()
-        if self._base_players is not None:
-            [obj.stop() for obj in self._base_players]
-        [obj.stop() for obj in self._base_objs]
+        trig_objs = self._trig_objs
+        if trig_objs is not None:
+            trig_objs.stop()
+        players = self._base_players
+        if players is not None:
+            for obj in players:
+                obj.stop()
+        for obj in self._base_objs:
+            obj.stop()
         return self
 
     def set(self, attr, value, port=0.025):
@@ -2303,22 +2712,15 @@ class Mix(PyoObject):
             input_objs = input.getBaseObjects()
         input_len = len(input_objs)
         if voices < 1:
-            voices = 1
-            num = 1
-        elif voices > input_len and voices > lmax:
-            num = voices
-        elif lmax > input_len:
-            num = lmax
+            # Only the first input stream is used.
+            voices = num = 1
         else:
-            num = input_len
-        sub_lists = []
-        for i in range(voices):
-            sub_lists.append([])
-        for i in range(num):
-            obj = input_objs[i % input_len]
-            sub_lists[i % voices].append(obj)
-        self._base_objs = [Mix_base(l, wrap(mul, i),
-                                    wrap(add, i)) for i, l in enumerate(sub_lists)]
+            num = max(voices, input_len, lmax)
+        # Voice v receives the input streams at positions v, v + voices, ...
+        sub_lists = [[input_objs[i % input_len] for i in range(v, num, voices)]
+                     for v in range(voices)]
+        self._base_objs = [Mix_base(l, m, a) for l, (m, a) in
+                           zip(sub_lists, _broadcast_args(voices, mul, add))]
         self.play()
 
 class Dummy(PyoObject):
@@ -2364,13 +2766,15 @@ class Dummy(PyoObject):
     """
     def __init__(self, objs_list):
         PyoObject.__init__(self)
-        self._objs_list = objs_list
-        tmp_list = []
-        for x in objs_list:
-            if isinstance(x, Dummy):
-                tmp_list.extend(x.getBaseObjects())
-            else:
-                tmp_list.append(x)
+        tmp_list = list(objs_list)
+        # Nested Dummy objects are expanded into their streams. Element
+        # types are gathered at C level, so lists of plain streams (the
+        # arithmetic operators' case) never enter the Python loop.
+        if any(issubclass(t, Dummy) for t in set(map(type, tmp_list))):
+            tmp_list = list(chain.from_iterable(
+                x.getBaseObjects() if isinstance(x, Dummy) else (x,)
+                for x in tmp_list))
+        self._objs_list = tmp_list
         self._base_objs = tmp_list
 
 class InputFader(PyoObject):
@@ -2420,8 +2824,8 @@ class InputFader(PyoObject):
         pyoArgsAssert(self, "oN", x, fadetime)
         self._input = x
         x, _ = convertArgsToLists(x)
-        [obj.setInput(wrap(x, i),
-                      fadetime) for i, obj in enumerate(self._base_objs)]
+        for i, obj in enumerate(self._base_objs):
+            obj.setInput(wrap(x, i), fadetime)
 
     @property
     def input(self):
@@ -2459,8 +2863,8 @@ class Sig(PyoObject):
         PyoObject.__init__(self, mul, add)
         self._value = value
         value, mul, add, lmax = convertArgsToLists(value, mul, add)
-        self._base_objs = [Sig_base(wrap(value, i), wrap(mul, i),
-                                    wrap(add, i)) for i in range(lmax)]
+        self._base_objs = [Sig_base(*args) for args in
+                           _broadcast_args(lmax, value, mul, add)]
         self.play()
 
     def setValue(self, x):
@@ -2476,7 +2880,9 @@ class Sig(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._value = x
         x, _ = convertArgsToLists(x)
-        [obj.setValue(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setValue(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0, 1, "lin", "value", self._value)]
@@ -2539,9 +2945,9 @@ class VarPort(PyoObject):
         self._function = getWeakMethodRef(function)
         value, time, init, function, arg, mul, add, lmax = convertArgsToLists(
             value, time, init, function, arg, mul, add)
-        self._base_objs = [VarPort_base(wrap(value, i), wrap(time, i), wrap(init, i),
-                                        WeakMethod(wrap(function, i)), wrap(arg, i),
-                                        wrap(mul, i), wrap(add, i)) for i in range(lmax)]
+        self._base_objs = [VarPort_base(v, t, ini, WeakMethod(f), a, m, ad)
+                           for v, t, ini, f, a, m, ad in _broadcast_args(
+                               lmax, value, time, init, function, arg, mul, add)]
         self.play()
 
     def setValue(self, x):
@@ -2557,7 +2963,9 @@ class VarPort(PyoObject):
         pyoArgsAssert(self, "n", x)
         self._value = x
         x, _ = convertArgsToLists(x)
-        [obj.setValue(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setValue(y)
 
     def setTime(self, x):
         """
@@ -2572,7 +2980,9 @@ class VarPort(PyoObject):
         pyoArgsAssert(self, "n", x)
         self._time = x
         x, _ = convertArgsToLists(x)
-        [obj.setTime(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setTime(y)
 
     def setFunction(self, x):
         """
@@ -2587,8 +2997,8 @@ class VarPort(PyoObject):
         pyoArgsAssert(self, "c", x)
         self._function = getWeakMethodRef(x)
         x, _ = convertArgsToLists(x)
-        [obj.setFunction(WeakMethod(wrap(x, i))) \
-         for i, obj in enumerate(self._base_objs)]
+        for i, obj in enumerate(self._base_objs):
+            obj.setFunction(WeakMethod(wrap(x, i)))
 
     @property
     def value(self):
@@ -2641,8 +3051,8 @@ class Pow(PyoObject):
         self._base = base
         self._exponent = exponent
         base, exponent, mul, add, lmax = convertArgsToLists(base, exponent, mul, add)
-        self._base_objs = [M_Pow_base(wrap(base, i), wrap(exponent, i),
-                                      wrap(mul, i), wrap(add, i)) for i in range(lmax)]
+        self._base_objs = [M_Pow_base(*args) for args in
+                           _broadcast_args(lmax, base, exponent, mul, add)]
         self.play()
 
     def setBase(self, x):
@@ -2658,7 +3068,9 @@ class Pow(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._base = x
         x, _ = convertArgsToLists(x)
-        [obj.setBase(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setBase(y)
 
     def setExponent(self, x):
         """
@@ -2673,7 +3085,9 @@ class Pow(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._exponent = x
         x, _ = convertArgsToLists(x)
-        [obj.setExponent(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setExponent(y)
 
     @property
     def base(self):
@@ -2736,8 +3150,8 @@ class Wrap(PyoObject):
         self._in_fader = InputFader(input)
         in_fader, min, max, mul, add, lmax = convertArgsToLists(
             self._in_fader, min, max, mul, add)
-        self._base_objs = [Wrap_base(wrap(in_fader, i), wrap(min, i), wrap(max, i),
-                                     wrap(mul, i), wrap(add, i)) for i in range(lmax)]
+        self._base_objs = [Wrap_base(*args) for args in
+                           _broadcast_args(lmax, in_fader, min, max, mul, add)]
         self.play()
 
     def setInput(self, x, fadetime=0.05):
@@ -2769,7 +3183,9 @@ class Wrap(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._min = x
         x, _ = convertArgsToLists(x)
-        [obj.setMin(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setMin(y)
 
     def setMax(self, x):
         """
@@ -2784,7 +3200,9 @@ class Wrap(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._max = x
         x, _ = convertArgsToLists(x)
-        [obj.setMax(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setMax(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0., 1., 'lin', 'min', self._min),
@@ -2845,6 +3263,9 @@ class Compare(PyoObject):
     >>> out = Selector(inputs=[a,b], voice=Port(ch)).out()
 
     """
+    # Operator strings mapped to the mode codes of Compare_base.
+    comp_dict = {"<": 0, "<=": 1, ">": 2, ">=": 3, "==": 4, "!=": 5}
+
     def __init__(self, input, comp, mode="<", mul=1, add=0):
         pyoArgsAssert(self, "oOsOO", input, comp, mode, mul, add)
         PyoObject.__init__(self, mul, add)
@@ -2852,14 +3273,11 @@ class Compare(PyoObject):
         self._comp = comp
         self._mode = mode
         self._in_fader = InputFader(input)
-        self.comp_dict = {"<": 0, "<=": 1, ">": 2, ">=": 3, "==": 4, "!=": 5}
         in_fader, comp, mode, mul, add, lmax = convertArgsToLists(
             self._in_fader, comp, mode, mul, add)
-        self._base_objs = [Compare_base(wrap(in_fader, i),
-                                        wrap(comp, i),
-                                        self.comp_dict[wrap(mode, i)],
-                                        wrap(mul, i),
-                                        wrap(add, i)) for i in range(lmax)]
+        modes = [self.comp_dict[m] for m in mode]
+        self._base_objs = [Compare_base(*args) for args in _broadcast_args(
+            lmax, in_fader, comp, modes, mul, add)]
         self.play()
 
     def out(self, chnl=0, inc=1, dur=0, delay=0):
@@ -2894,7 +3312,9 @@ class Compare(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._comp = x
         x, _ = convertArgsToLists(x)
-        [obj.setComp(wrap(x, i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setComp(y)
 
     def setMode(self, x):
         """
@@ -2911,8 +3331,11 @@ class Compare(PyoObject):
         pyoArgsAssert(self, "s", x)
         self._mode = x
         x, _ = convertArgsToLists(x)
-        [obj.setMode(self.comp_dict[wrap(x, i)]) \
-         for i, obj in enumerate(self._base_objs)]
+        # Each distinct operator string is looked up once, before cycling.
+        modes = [self.comp_dict[m] for m in x]
+        base = self._base_objs
+        for obj, m in zip(base, _wrap_values(modes, len(base))):
+            obj.setMode(m)
 
     @property
     def input(self):
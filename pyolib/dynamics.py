@@ -25,6 +25,7 @@ License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from ._core import *
+from ._core import _broadcast_args, _wrap_values
 from ._maps import *
 
 class Clip(PyoObject):
@@ -58,7 +59,7 @@ class Clip(PyoObject):
         self._max = max
         self._in_fader = InputFader(input)
         in_fader, min, max, mul, add, lmax = convertArgsToLists(self._in_fader, min, max, mul, add)
-        self._base_objs = [Clip_base(wrap(in_fader,i), wrap(min,i), wrap(max,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
+        self._base_objs = [Clip_base(*args) for args in _broadcast_args(lmax, in_fader, min, max, mul, add)]
         self.play()
 
     def setInput(self, x, fadetime=0.05):
@@ -90,7 +91,9 @@ class Clip(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._min = x
         x, lmax = convertArgsToLists(x)
-        [obj.setMin(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setMin(y)
 
     def setMax(self, x):
         """
@@ -105,7 +108,9 @@ class Clip(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._max = x
         x, lmax = convertArgsToLists(x)
-        [obj.setMax(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setMax(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(-1., 0., 'lin', 'min', self._min),
@@ -205,7 +210,9 @@ class Mirror(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._min = x
         x, lmax = convertArgsToLists(x)
-        [obj.setMin(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setMin(y)
 
     def setMax(self, x):
         """
@@ -220,7 +227,9 @@ class Mirror(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._max = x
         x, lmax = convertArgsToLists(x)
-        [obj.setMax(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setMax(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0., 1., 'lin', 'min', self._min),
@@ -318,7 +327,9 @@ class Degrade(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._bitdepth = x
         x, lmax = convertArgsToLists(x)
-        [obj.setBitdepth(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setBitdepth(y)
 
     def setSrscale(self, x):
         """
@@ -333,7 +344,9 @@ class Degrade(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._srscale = x
         x, lmax = convertArgsToLists(x)
-        [obj.setSrscale(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setSrscale(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(1., 32., 'log', 'bitdepth', self._bitdepth),
@@ -455,7 +468,9 @@ class Compress(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._thresh = x
         x, lmax = convertArgsToLists(x)
-        [obj.setThresh(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setThresh(y)
 
     def setRatio(self, x):
         """
@@ -470,7 +485,9 @@ class Compress(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._ratio = x
         x, lmax = convertArgsToLists(x)
-        [obj.setRatio(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setRatio(y)
 
     def setRiseTime(self, x):
         """
@@ -485,7 +502,9 @@ class Compress(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._risetime = x
         x, lmax = convertArgsToLists(x)
-        [obj.setRiseTime(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setRiseTime(y)
 
     def setFallTime(self, x):
         """
@@ -500,7 +519,9 @@ class Compress(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._falltime = x
         x, lmax = convertArgsToLists(x)
-        [obj.setFallTime(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setFallTime(y)
 
     def setLookAhead(self, x):
         """
@@ -515,7 +536,9 @@ class Compress(PyoObject):
         pyoArgsAssert(self, "n", x)
         self._lookahead = x
         x, lmax = convertArgsToLists(x)
-        [obj.setLookAhead(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setLookAhead(y)
 
     def setKnee(self, x):
         """
@@ -530,7 +553,9 @@ class Compress(PyoObject):
         pyoArgsAssert(self, "n", x)
         self._knee = x
         x, lmax = convertArgsToLists(x)
-        [obj.setKnee(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setKnee(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(-60., 0., 'lin', 'thresh', self._thresh),
@@ -674,7 +699,9 @@ class Gate(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._thresh = x
         x, lmax = convertArgsToLists(x)
-        [obj.setThresh(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setThresh(y)
 
     def setRiseTime(self, x):
         """
@@ -689,7 +716,9 @@ class Gate(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._risetime = x
         x, lmax = convertArgsToLists(x)
-        [obj.setRiseTime(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setRiseTime(y)
 
     def setFallTime(self, x):
         """
@@ -704,7 +733,9 @@ class Gate(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._falltime = x
         x, lmax = convertArgsToLists(x)
-        [obj.setFallTime(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setFallTime(y)
 
     def setLookAhead(self, x):
         """
@@ -719,7 +750,9 @@ class Gate(PyoObject):
         pyoArgsAssert(self, "n", x)
         self._lookahead = x
         x, lmax = convertArgsToLists(x)
-        [obj.setLookAhead(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setLookAhead(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(-100., 0., 'lin', 'thresh', self._thresh),
@@ -851,7 +884,9 @@ class Balance(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._freq = x
         x, lmax = convertArgsToLists(x)
-        [obj.setFreq(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setFreq(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0.1, 100., "log", "freq", self._freq), SLMapMul(self._mul)]
@@ -939,7 +974,9 @@ class Min(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._comp = x
         x, lmax = convertArgsToLists(x)
-        [obj.setComp(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setComp(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0,1,"lin", "comp", self._comp), SLMapMul(self._mul)]
@@ -1020,7 +1057,9 @@ class Max(PyoObject):
         pyoArgsAssert(self, "O", x)
         self._comp = x
         x, lmax = convertArgsToLists(x)
-        [obj.setComp(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        base = self._base_objs
+        for obj, y in zip(base, _wrap_values(x, len(base))):
+            obj.setComp(y)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0,1,"lin", "comp", self._comp), SLMapMul(self._mul)]
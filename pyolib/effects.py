@@ -1824,25 +1824,22 @@ class FreqShift(PyoObject):
 
     def play(self, dur=0, delay=0):
         dur, delay, lmax = convertArgsToLists(dur, delay)
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._hilb_objs)]
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._sin_objs)]
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._cos_objs)]
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._mod_objs)]
+        for objs in (self._hilb_objs, self._sin_objs, self._cos_objs, self._mod_objs):
+            for i, obj in enumerate(objs):
+                obj.play(wrap(dur,i), wrap(delay,i))
         return PyoObject.play(self, dur, delay)
 
     def stop(self):
-        [obj.stop() for obj in self._hilb_objs]
-        [obj.stop() for obj in self._sin_objs]
-        [obj.stop() for obj in self._cos_objs]
-        [obj.stop() for obj in self._mod_objs]
+        for objs in (self._hilb_objs, self._sin_objs, self._cos_objs, self._mod_objs):
+            for obj in objs:
+                obj.stop()
         return PyoObject.stop(self)
 
     def out(self, chnl=0, inc=1, dur=0, delay=0):
         dur, delay, lmax = convertArgsToLists(dur, delay)
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._hilb_objs)]
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._sin_objs)]
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._cos_objs)]
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._mod_objs)]
+        for objs in (self._hilb_objs, self._sin_objs, self._cos_objs, self._mod_objs):
+            for i, obj in enumerate(objs):
+                obj.play(wrap(dur,i), wrap(delay,i))
         return PyoObject.out(self, chnl, inc, dur, delay)
 
     def setInput(self, x, fadetime=0.05):
@@ -1815,7 +1815,7 @@ class SndTable(PyoTableObject):
         createSndViewTableWindow(self, title, wxnoserver, self.__class__.__name__, mouse_callback)
 
     def refreshView(self):
-        if self.viewFrame is not None:
+        if self.viewFrame is not None and not self._view_suspended:
             self.viewFrame.update()
 
     def _resetView(self):
@@ -2024,7 +2024,7 @@ class NewTable(PyoTableObject):
         createSndViewTableWindow(self, title, wxnoserver, self.__class__.__name__, mouse_callback)
 
     def refreshView(self):
-        if self.viewFrame is not None:
+        if self.viewFrame is not None and not self._view_suspended:
             self.viewFrame.update()
 
     @property
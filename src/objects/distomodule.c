@@ -1428,15 +1428,11 @@ Wrap_transform_ii(Wrap *self) {
         rng = ma - mi;
         for (i=0; i<self->bufsize; i++) {
             val = in[i];
-            tmp = (val - mi) / rng;
-            if (tmp >= 1.0) {
-                tmp -= (int)tmp;
-                val = tmp * rng + mi;
-            }
-            else if (tmp < 0) {
-                tmp += (int)(-tmp) + 1;
+            if (val >= ma || val < mi) {
+                tmp = (val - mi) / rng;
+                tmp -= MYFLOOR(tmp);
                 val = tmp * rng + mi;
-                if (val == ma)
+                if (val >= ma)
                     val = mi;
             }
             self->data[i] = val;
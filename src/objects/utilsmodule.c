@@ -1744,67 +1744,55 @@ typedef struct {
     Stream *input_stream;
     PyObject *comp;
     Stream *comp_stream;
-    MYFLT (*compare_func_ptr)(MYFLT, MYFLT); // true = 1.0, false = 0.0
+    int comp_mode; // 0: <, 1: <=, 2: >, 3: >=, 4: ==, 5: !=
     int modebuffer[3]; // need at least 2 slots for mul & add
 } Compare;
 
-static MYFLT
-Compare_lt(MYFLT in, MYFLT comp) {
-    if (in < comp) { return 1.0; }
-    else { return 0.0; }
-}
-
-static MYFLT
-Compare_elt(MYFLT in, MYFLT comp) {
-    if (in <= comp) { return 1.0; }
-    else { return 0.0; }
-}
-
-static MYFLT
-Compare_gt(MYFLT in, MYFLT comp) {
-    if (in > comp) { return 1.0; }
-    else { return 0.0; }
-}
-
-static MYFLT
-Compare_egt(MYFLT in, MYFLT comp) {
-    if (in >= comp) { return 1.0; }
-    else { return 0.0; }
-}
-
-static MYFLT
-Compare_eq(MYFLT in, MYFLT comp) {
-    if (in >= (comp - 0.0001) && in <= (comp + 0.0001)) { return 1.0; }
-    else { return 0.0; }
-}
-
-static MYFLT
-Compare_neq(MYFLT in, MYFLT comp) {
-    if (in <= (comp - 0.0001) || in >= (comp + 0.0001)) { return 1.0; }
-    else { return 0.0; }
-}
-
-static void
-Compare_process_i(Compare *self) {
-    int i;
-    MYFLT *in = Stream_getData((Stream *)self->input_stream);
-    MYFLT comp = PyFloat_AS_DOUBLE(self->comp);
-
-    for (i=0; i<self->bufsize; i++) {
-        self->data[i] = (*self->compare_func_ptr)(in[i], comp);
-    }
-}
-
-static void
-Compare_process_a(Compare *self) {
-    int i;
-    MYFLT *in = Stream_getData((Stream *)self->input_stream);
-    MYFLT *comp = Stream_getData((Stream *)self->comp_stream);
-
-    for (i=0; i<self->bufsize; i++) {
-        self->data[i] = (*self->compare_func_ptr)(in[i], comp[i]);
-    }
-}
+/* One processing function per operator and comp type, so each loop body
+   is a single comparison the compiler can vectorize. Results are converted
+   from the 0/1 comparison itself, and the tolerance tests use
+   non-short-circuit operators, so no loop body branches. */
+#define COMPARE_LT(x, c) ((x) < (c))
+#define COMPARE_LE(x, c) ((x) <= (c))
+#define COMPARE_GT(x, c) ((x) > (c))
+#define COMPARE_GE(x, c) ((x) >= (c))
+#define COMPARE_EQ(x, c) (((x) >= ((c) - 0.0001)) & ((x) <= ((c) + 0.0001)))
+#define COMPARE_NEQ(x, c) (((x) <= ((c) - 0.0001)) | ((x) >= ((c) + 0.0001)))
+
+#define COMPARE_PROCESS_FUNCS(NAME, TEST) \
+static void \
+Compare_process_##NAME##_i(Compare *self) { \
+    int i; \
+    MYFLT *in = Stream_getData((Stream *)self->input_stream); \
+    MYFLT comp = PyFloat_AS_DOUBLE(self->comp); \
+    for (i=0; i<self->bufsize; i++) \
+        self->data[i] = (MYFLT)TEST(in[i], comp); \
+} \
+static void \
+Compare_process_##NAME##_a(Compare *self) { \
+    int i; \
+    MYFLT *in = Stream_getData((Stream *)self->input_stream); \
+    MYFLT *comp = Stream_getData((Stream *)self->comp_stream); \
+    for (i=0; i<self->bufsize; i++) \
+        self->data[i] = (MYFLT)TEST(in[i], comp[i]); \
+}
+
+COMPARE_PROCESS_FUNCS(lt, COMPARE_LT)
+COMPARE_PROCESS_FUNCS(le, COMPARE_LE)
+COMPARE_PROCESS_FUNCS(gt, COMPARE_GT)
+COMPARE_PROCESS_FUNCS(ge, COMPARE_GE)
+COMPARE_PROCESS_FUNCS(eq, COMPARE_EQ)
+COMPARE_PROCESS_FUNCS(neq, COMPARE_NEQ)
+
+/* Indexed by [comp_mode][modebuffer[2]]. */
+static void (*Compare_process_funcs[6][2])(Compare *self) = {
+    {Compare_process_lt_i, Compare_process_lt_a},
+    {Compare_process_le_i, Compare_process_le_a},
+    {Compare_process_gt_i, Compare_process_gt_a},
+    {Compare_process_ge_i, Compare_process_ge_a},
+    {Compare_process_eq_i, Compare_process_eq_a},
+    {Compare_process_neq_i, Compare_process_neq_a}
+};
 
 static void Compare_postprocessing_ii(Compare *self) { POST_PROCESSING_II };
 static void Compare_postprocessing_ai(Compare *self) { POST_PROCESSING_AI };
@@ -1823,14 +1811,8 @@ Compare_setProcMode(Compare *self)
     procmode = self->modebuffer[2];
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
 
-	switch (procmode) {
-        case 0:
-            self->proc_func_ptr = Compare_process_i;
-            break;
-        case 1:
-            self->proc_func_ptr = Compare_process_a;
-            break;
-    }
+    self->proc_func_ptr = Compare_process_funcs[self->comp_mode][procmode];
+
 	switch (muladdmode) {
         case 0:
             self->muladd_func_ptr = Compare_postprocessing_ii;
@@ -1911,7 +1893,7 @@ Compare_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 	self->modebuffer[1] = 0;
 	self->modebuffer[2] = 0;
 
-    self->compare_func_ptr = Compare_lt;
+    self->comp_mode = 0;
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Compare_compute_next_data_frame);
@@ -2009,18 +1991,10 @@ Compare_setMode(Compare *self, PyObject *arg)
 
     int tmp = PyInt_AsLong(arg);
 
-    if (tmp == 0)
-        self->compare_func_ptr = Compare_lt;
-    else if (tmp == 1)
-        self->compare_func_ptr = Compare_elt;
-    else if (tmp == 2)
-        self->compare_func_ptr = Compare_gt;
-    else if (tmp == 3)
-        self->compare_func_ptr = Compare_egt;
-    else if (tmp == 4)
-        self->compare_func_ptr = Compare_eq;
-    else if (tmp == 5)
-        self->compare_func_ptr = Compare_neq;
+    if (tmp >= 0 && tmp <= 5) {
+        self->comp_mode = tmp;
+        (*self->mode_func_ptr)(self);
+    }
 
     Py_RETURN_NONE;
 }